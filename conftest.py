@@ -0,0 +1,3 @@
+"""
+Makes the repository root importable so tests can import the package from src.
+"""
@@ -15,13 +15,13 @@ async def main():
     
     # Create monitor with custom settings
     monitor = Monitor(
-        update_interval=90,  # Update every 90 seconds
+        update_interval=90,  # At most one update every 90 seconds
         timeout_threshold=900  # 15 minute timeout
     )
     
     # Define callbacks
     def on_progress(task_id: str, percentage: int):
-        """Called every 90 seconds with progress update."""
+        """Called with progress updates, at most every 90 seconds."""
         print(f"📊 Task {task_id} progress: {percentage}%")
     
     def on_complete(task_id: str, result):
@@ -18,12 +18,13 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "Operational Neural Network"
 
-from .monitor import Monitor, spawn_with_monitoring
+from .monitor import Monitor, TaskSnapshot, spawn_with_monitoring
 from .progress import ProgressTracker, ProgressBar
 from .exceptions import TimeoutError, SubagentError
 
 __all__ = [
     'Monitor',
+    'TaskSnapshot',
     'spawn_with_monitoring',
     'ProgressTracker',
     'ProgressBar',
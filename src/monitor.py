@@ -6,39 +6,94 @@ progress tracking and status updates.
 """
 
 import asyncio
+import functools
+import itertools
+import sys
 import time
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, Callable, List, NamedTuple
 from dataclasses import dataclass, field
 import logging
 
 from .progress import ProgressTracker, ProgressBar
 from .exceptions import TimeoutError, SubagentError
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Library logging: leave handler configuration to the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
+_PROGRESS_TMPL = """
+📊 Progress Update
+
+Task: {task_id}
+Status: {status}
+Progress: {bar} {pct}%
+Elapsed: {mins}m
+"""
+
+_INV_60 = 1.0 / 60.0
+
+# Suffix for default task ids, unique even for tasks spawned in the same second
+_task_counter = itertools.count()
+
+# Seconds between progress reports from the simulated subagent
+_SIMULATION_STEP = 5
+
+
+@functools.lru_cache(maxsize=256)
+def _make_bar(percentage: int, width: int = 10) -> str:
+    """Render a progress bar, reusing the result for repeated percentages."""
+    return ProgressBar(percentage, width).render()
 
-@dataclass
+
+# Slotted dataclasses need Python 3.10+; older versions fall back to __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SubagentTask:
     """Represents a subagent task being monitored."""
     task_id: str
     description: str
-    start_time: datetime
+    start_time: float  # time.monotonic() seconds
     timeout: int  # seconds
     tools: List[str] = field(default_factory=list)
     status: str = "running"  # running, completed, failed, timeout
     progress: int = 0  # 0-100
-    last_update: datetime = field(default_factory=datetime.utcnow)
+    last_update: float = field(default_factory=time.monotonic)
+    last_update_ts: float = 0.0  # time.monotonic() of the last progress update sent
     check_interval: int = 60  # seconds
-    next_check: datetime = field(default_factory=lambda: datetime.utcnow() + timedelta(minutes=1))
+    result: Any = None
+    _progress_event: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _done_event: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+
+    def report_progress(self, percentage: int):
+        """Record new progress from the subagent and wake the monitor."""
+        self.progress = percentage
+        self.last_update = time.monotonic()
+        self._progress_event.set()
+
+    def complete(self, result: Any):
+        """Record the subagent result and wake the monitor."""
+        self.result = result
+        self._done_event.set()
+
+
+class TaskSnapshot(NamedTuple):
+    """Point-in-time view of an active task."""
+    task_id: str
+    status: str
+    progress: int
+    elapsed: int  # seconds
 
 
 class Monitor:
     """
     Monitors Claude subagent execution with automatic progress tracking.
     
+    Progress updates are sent when the subagent reports progress, at most
+    once every update_interval seconds. A subagent that stops reporting
+    sends no updates until it completes, fails, or times out.
+    
     Usage:
         monitor = Monitor(update_interval=90)
         result = await monitor.spawn_with_monitoring(
@@ -53,7 +108,7 @@ class Monitor:
         Initialize the monitor.
         
         Args:
-            update_interval: Seconds between progress updates (default: 90)
+            update_interval: Minimum seconds between progress updates (default: 90)
             timeout_threshold: Seconds before considering task stuck (default: 900 = 15 min)
         """
         self.update_interval = update_interval
@@ -62,6 +117,8 @@ class Monitor:
         self.progress_tracker = ProgressTracker()
         self._running = False
         self._monitor_task = None
+        self._pending_callbacks: List[tuple] = []
+        self._drain_scheduled = False
         
     async def spawn_with_monitoring(
         self,
@@ -85,6 +142,11 @@ class Monitor:
             on_complete: Callback on completion (task_id, result)
             on_error: Callback on error (task_id, exception)
             
+        Progress callbacks run from the event loop after the update is sent,
+        not inside the task. An exception raised by on_progress is reported
+        to the loop's exception handler and does not fail the task or reach
+        on_error.
+            
         Returns:
             Task result
             
@@ -93,13 +155,13 @@ class Monitor:
             SubagentError: If subagent fails
         """
         
-        task_id = task_id or f"task_{int(time.time())}"
+        task_id = task_id or f"task_{int(time.time())}_{next(_task_counter)}"
         
         # Create task record
         subagent_task = SubagentTask(
             task_id=task_id,
             description=task,
-            start_time=datetime.utcnow(),
+            start_time=time.monotonic(),
             timeout=timeout,
             tools=tools,
             check_interval=60
@@ -107,7 +169,7 @@ class Monitor:
         
         self.active_tasks[task_id] = subagent_task
         
-        logger.info(f"✅ Spawned subagent: {task_id}")
+        logger.info("✅ Spawned subagent: %s", task_id)
         print(f"✅ Task '{task_id}' started. Will update every {self.update_interval}s.")
         
         try:
@@ -122,19 +184,24 @@ class Monitor:
             subagent_task.status = "completed"
             subagent_task.progress = 100
             
+            # Deliver queued progress callbacks before the completion callback
+            self._drain_callbacks()
+            
             if on_complete:
                 on_complete(task_id, result)
             
-            logger.info(f"✅ Task completed: {task_id}")
+            logger.info("✅ Task completed: %s", task_id)
             print(f"✅ Task '{task_id}' completed!")
             
             return result
             
         except asyncio.TimeoutError:
             subagent_task.status = "timeout"
-            logger.error(f"❌ Task timed out: {task_id}")
+            logger.error("❌ Task timed out: %s", task_id)
             print(f"❌ Task '{task_id}' timed out after {timeout}s")
             
+            self._drain_callbacks()
+            
             if on_error:
                 on_error(task_id, TimeoutError(f"Task {task_id} timed out"))
             
@@ -142,18 +209,23 @@ class Monitor:
             
         except Exception as e:
             subagent_task.status = "failed"
-            logger.error(f"❌ Task failed: {task_id} - {e}")
+            logger.error("❌ Task failed: %s - %s", task_id, e)
             print(f"❌ Task '{task_id}' failed: {e}")
             
+            self._drain_callbacks()
+            
             if on_error:
                 on_error(task_id, e)
             
             raise SubagentError(f"Task {task_id} failed: {e}")
             
         finally:
-            # Cleanup
-            if task_id in self.active_tasks:
+            # Cleanup, unless another task has since claimed this id. The
+            # identity check needs a lookup before removal, so dict.pop alone
+            # can't be used here.
+            if self.active_tasks.get(task_id) is subagent_task:
                 del self.active_tasks[task_id]
+                self.progress_tracker.remove(task_id)
     
     async def _execute_with_monitoring(
         self,
@@ -165,61 +237,135 @@ class Monitor:
         """
         Execute task with progress monitoring.
         
-        This simulates the actual Claude subagent execution.
-        In real usage, this would call Claude's API.
+        The deadline is enforced once by ``asyncio.wait_for`` rather than
+        checked on every wakeup.
         """
         
-        start_time = time.time()
-        last_update = start_time
+        return await asyncio.wait_for(
+            self._run_task(task, on_progress),
+            timeout=task.timeout
+        )
+    
+    async def _run_task(
+        self,
+        task: SubagentTask,
+        on_progress: Optional[Callable]
+    ) -> Any:
+        """
+        Run the subagent and relay its progress until it completes.
+        
+        The monitor sleeps until the subagent reports progress or completes,
+        rather than polling on a fixed interval.
+        """
+        
+        task.last_update_ts = time.monotonic()
         
-        # Simulate task execution with progress updates
         # In real implementation, this would integrate with Claude's API
-        while True:
-            elapsed = time.time() - start_time
+        producer = asyncio.ensure_future(self._simulate_subagent(task))
+        done_waiter = asyncio.ensure_future(task._done_event.wait())
+        progress_waiter = asyncio.ensure_future(task._progress_event.wait())
+        
+        try:
+            while not task._done_event.is_set():
+                await asyncio.wait(
+                    [producer, done_waiter, progress_waiter],
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                # Only replace the progress waiter once it has fired
+                if progress_waiter.done():
+                    task._progress_event.clear()
+                    progress_waiter = asyncio.ensure_future(task._progress_event.wait())
+                    
+                    # Send progress update at most every update_interval seconds
+                    now = time.monotonic()
+                    if now - task.last_update_ts >= self.update_interval:
+                        self._send_progress_update(task, on_progress, now)
+                        task.last_update_ts = now
+                
+                # A subagent that stops without completing has failed
+                if producer.done() and not task._done_event.is_set():
+                    # Wrap producer errors so that only the wait_for deadline,
+                    # not an upstream asyncio.TimeoutError, reports a timeout
+                    exc = producer.exception()
+                    if exc is not None:
+                        raise SubagentError(str(exc) or type(exc).__name__) from exc
+                    raise SubagentError("subagent finished without a result")
             
-            # Check for timeout
-            if elapsed > task.timeout:
-                raise asyncio.TimeoutError()
+            return task.result
             
-            # Simulate progress (in real use, this comes from Claude)
-            task.progress = min(100, int((elapsed / task.timeout) * 100 * 2))
-            task.last_update = datetime.utcnow()
+        finally:
+            progress_waiter.cancel()
+            done_waiter.cancel()
+            producer.cancel()
+    
+    async def _simulate_subagent(self, task: SubagentTask):
+        """
+        Simulate the actual Claude subagent execution.
+        
+        In real usage, this would call Claude's API and report progress
+        through ``task.report_progress`` and ``task.complete``.
+        """
+        
+        start_time = time.monotonic()
+        finish_after = task.timeout / 2
+        
+        while True:
+            elapsed = time.monotonic() - start_time
             
-            # Send progress update every update_interval seconds
-            if time.time() - last_update >= self.update_interval:
-                self._send_progress_update(task, on_progress)
-                last_update = time.time()
+            # Simulate progress (in real use, this comes from Claude)
+            progress = 100 if elapsed * 2 >= task.timeout else int(elapsed * 200 / task.timeout)
+            task.report_progress(progress)
             
-            # Check if task is complete (simulate completion at 100%)
-            if task.progress >= 100:
-                return {"status": "success", "task_id": task.task_id, "result": "Task completed"}
+            # Simulate completion at 100%
+            if progress >= 100:
+                task.complete({"status": "success", "task_id": task.task_id, "result": "Task completed"})
+                return
             
-            # Sleep before next check
-            await asyncio.sleep(5)
+            await asyncio.sleep(min(_SIMULATION_STEP, finish_after - elapsed))
     
     def _send_progress_update(
         self,
         task: SubagentTask,
-        on_progress: Optional[Callable]
+        on_progress: Optional[Callable],
+        now: float
     ):
-        """Send progress update to user."""
+        """Send progress update to user. ``now`` is the current time.monotonic()."""
         
-        progress_bar = ProgressBar(task.progress)
-        bar_display = progress_bar.render()
+        self.progress_tracker.add_update(task.task_id, task.progress)
         
-        message = f"""
-📊 Progress Update
-
-Task: {task.task_id}
-Status: {task.status}
-Progress: {bar_display} {task.progress}%
-Elapsed: {int((datetime.utcnow() - task.start_time).total_seconds() / 60)}m
-"""
-        
-        print(message)
+        print(_PROGRESS_TMPL.format(
+            task_id=task.task_id,
+            status=task.status,
+            bar=_make_bar(task.progress),
+            pct=task.progress,
+            mins=int((now - task.start_time) * _INV_60)
+        ))
         
         if on_progress:
-            on_progress(task.task_id, task.progress)
+            # Queue the callback; all callbacks queued in this loop iteration
+            # run together from a single scheduled drain
+            self._pending_callbacks.append((on_progress, (task.task_id, task.progress)))
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                asyncio.get_running_loop().call_soon(self._drain_callbacks)
+    
+    def _drain_callbacks(self):
+        """Run all queued progress callbacks."""
+        
+        self._drain_scheduled = False
+        pending, self._pending_callbacks = self._pending_callbacks, []
+        
+        for callback, args in pending:
+            try:
+                callback(*args)
+            except Exception as e:
+                # Report through the loop so the error and traceback are
+                # visible even when the application hasn't configured logging
+                asyncio.get_running_loop().call_exception_handler({
+                    "message": f"Progress callback failed for task {args[0]}",
+                    "exception": e,
+                })
     
     def check_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -239,8 +385,9 @@ Elapsed: {int((datetime.utcnow() - task.start_time).total_seconds() / 60)}m
             "task_id": task.task_id,
             "status": task.status,
             "progress": task.progress,
-            "elapsed": int((datetime.utcnow() - task.start_time).total_seconds()),
-            "description": task.description
+            "elapsed": int(time.monotonic() - task.start_time),
+            "description": task.description,
+            "eta": self.progress_tracker.estimate_completion(task_id)
         }
     
     def kill_task(self, task_id: str) -> bool:
@@ -254,30 +401,43 @@ Elapsed: {int((datetime.utcnow() - task.start_time).total_seconds() / 60)}m
             True if killed successfully
         """
         if task_id not in self.active_tasks:
-            logger.warning(f"Task {task_id} not found")
+            logger.warning("Task %s not found", task_id)
             return False
         
         task = self.active_tasks[task_id]
         task.status = "killed"
         
-        logger.info(f"🛑 Killed task: {task_id}")
+        logger.info("🛑 Killed task: %s", task_id)
         print(f"🛑 Task '{task_id}' killed")
         
         return True
     
-    def list_active_tasks(self) -> List[Dict[str, Any]]:
+    def list_active_tasks(self) -> List[TaskSnapshot]:
         """List all active tasks."""
+        now = time.monotonic()
         return [
-            {
-                "task_id": task.task_id,
-                "status": task.status,
-                "progress": task.progress,
-                "elapsed": int((datetime.utcnow() - task.start_time).total_seconds())
-            }
+            TaskSnapshot(
+                task.task_id,
+                task.status,
+                task.progress,
+                int(now - task.start_time)
+            )
             for task in self.active_tasks.values()
         ]
 
 
+# Shared monitor for the convenience function, created on first use
+_default_monitor: Optional[Monitor] = None
+
+
+def _get_default() -> Monitor:
+    """Return the shared default Monitor, creating it if needed."""
+    global _default_monitor
+    if _default_monitor is None:
+        _default_monitor = Monitor()
+    return _default_monitor
+
+
 # Convenience function for simple usage
 async def spawn_with_monitoring(
     task: str,
@@ -288,6 +448,8 @@ async def spawn_with_monitoring(
     """
     Convenience function to spawn and monitor a task.
     
+    All calls share one default Monitor.
+    
     Args:
         task: Task description
         tools: Tools to provide
@@ -297,5 +459,4 @@ async def spawn_with_monitoring(
     Returns:
         Task result
     """
-    monitor = Monitor()
-    return await monitor.spawn_with_monitoring(task, tools, timeout, **kwargs)
+    return await _get_default().spawn_with_monitoring(task, tools, timeout, **kwargs)
@@ -2,8 +2,37 @@
 Progress tracking utilities for Claude Progress Monitor.
 """
 
+from collections import defaultdict, deque, namedtuple
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+# Pre-rendered bars for the default width, indexed by filled cells
+_BARS = tuple('▰' * i + '▱' * (10 - i) for i in range(11))
+
+# A single recorded progress update
+Sample = namedtuple('Sample', 'percentage timestamp')
+
+# Number of most recent updates kept per task and used to estimate the rate
+_RATE_WINDOW = 16
+
+
+def _rate(percentages: Sequence[float], minutes: Sequence[float]) -> float:
+    """Least-squares slope of percentages over minutes."""
+    n = len(minutes)
+    mean_t = sum(minutes) / n
+    mean_p = sum(percentages) / n
+    
+    num = 0.0
+    den = 0.0
+    for t, p in zip(minutes, percentages):
+        dt = t - mean_t
+        num += dt * (p - mean_p)
+        den += dt * dt
+    
+    if den == 0:
+        return 0.0
+    
+    return num / den
 
 
 class ProgressBar:
@@ -19,44 +48,64 @@ class ProgressBar:
         """
         self.percentage = max(0, min(100, percentage))
         self.width = width
+        self._str_key: Optional[Tuple[int, int]] = None
+        self._str = ""
     
     def render(self) -> str:
         """Render the progress bar as a string."""
         filled = int(self.percentage / 100 * self.width)
+        # percentage is public and may be set outside 0-100 after init
+        if self.width == 10 and 0 <= filled <= 10:
+            return _BARS[filled]
         empty = self.width - filled
         return '▰' * filled + '▱' * empty
     
     def __str__(self) -> str:
-        return f"{self.render()} {self.percentage}%"
+        key = (self.percentage, self.width)
+        if key != self._str_key:
+            self._str = f"{self.render()} {self.percentage}%"
+            self._str_key = key
+        return self._str
 
 
 class ProgressTracker:
     """Tracks progress updates over time."""
     
     def __init__(self):
-        self.updates: Dict[str, list] = {}
+        self.updates: Dict[str, Deque[Sample]] = {}
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._summaries: Dict[str, Tuple[Sample, dict]] = {}
     
     def add_update(self, task_id: str, percentage: int, timestamp: Optional[datetime] = None):
         """
         Record a progress update.
         
+        Only the most recent updates are kept for each task, but the
+        total count reported by get_summary includes all of them.
+        
         Args:
             task_id: Task identifier
             percentage: Progress percentage
             timestamp: Update timestamp (defaults to now)
         """
-        if task_id not in self.updates:
-            self.updates[task_id] = []
-        
-        self.updates[task_id].append({
-            'percentage': percentage,
-            'timestamp': timestamp or datetime.utcnow()
-        })
+        self.updates.setdefault(task_id, deque(maxlen=_RATE_WINDOW)).append(
+            Sample(percentage, timestamp or datetime.utcnow())
+        )
+        self._counts[task_id] += 1
+    
+    def remove(self, task_id: str):
+        """Forget all recorded updates for a task."""
+        self.updates.pop(task_id, None)
+        self._counts.pop(task_id, None)
+        self._summaries.pop(task_id, None)
     
     def get_progress_rate(self, task_id: str) -> float:
         """
         Calculate progress rate (percentage per minute).
         
+        The rate is the least-squares slope over the most recent updates,
+        so it follows changes in pace instead of averaging the whole run.
+        
         Args:
             task_id: Task identifier
             
@@ -66,17 +115,13 @@ class ProgressTracker:
         if task_id not in self.updates or len(self.updates[task_id]) < 2:
             return 0.0
         
-        updates = self.updates[task_id]
-        first = updates[0]
-        last = updates[-1]
-        
-        time_diff = (last['timestamp'] - first['timestamp']).total_seconds() / 60
-        progress_diff = last['percentage'] - first['percentage']
+        window = self.updates[task_id]
+        start = window[0].timestamp
         
-        if time_diff == 0:
-            return 0.0
+        minutes = [(u.timestamp - start).total_seconds() / 60 for u in window]
+        percentages = [u.percentage for u in window]
         
-        return progress_diff / time_diff
+        return _rate(percentages, minutes)
     
     def estimate_completion(self, task_id: str) -> Optional[datetime]:
         """
@@ -96,12 +141,12 @@ class ProgressTracker:
             return None
         
         updates = self.updates[task_id]
-        current_progress = updates[-1]['percentage']
+        current_progress = updates[-1].percentage
         remaining = 100 - current_progress
         
         minutes_remaining = remaining / rate
         
-        return updates[-1]['timestamp'] + timedelta(minutes=minutes_remaining)
+        return updates[-1].timestamp + timedelta(minutes=minutes_remaining)
     
     def get_summary(self, task_id: str) -> dict:
         """Get progress summary for a task."""
@@ -114,10 +159,19 @@ class ProgressTracker:
             }
         
         updates = self.updates[task_id]
+        last = updates[-1]
         
-        return {
-            'updates': len(updates),
-            'current_progress': updates[-1]['percentage'],
+        # Summaries only change when a new update arrives
+        cached = self._summaries.get(task_id)
+        if cached is not None and cached[0] is last:
+            return dict(cached[1])
+        
+        summary = {
+            'updates': self._counts[task_id],
+            'current_progress': last.percentage,
             'rate': self.get_progress_rate(task_id),
             'estimated_completion': self.estimate_completion(task_id)
         }
+        self._summaries[task_id] = (last, summary)
+        
+        return dict(summary)
@@ -0,0 +1,111 @@
+"""
+Tests for Monitor task execution.
+"""
+
+import asyncio
+
+import pytest
+
+from src import Monitor, SubagentError, TimeoutError
+from src import monitor as monitor_module
+
+
+@pytest.mark.asyncio
+async def test_completes_with_result():
+    monitor = Monitor(update_interval=0)
+    completed = []
+    
+    result = await monitor.spawn_with_monitoring(
+        task="Quick task",
+        tools=[],
+        timeout=0.2,
+        task_id="done-001",
+        on_complete=lambda task_id, result: completed.append(task_id)
+    )
+    
+    assert result == {"status": "success", "task_id": "done-001", "result": "Task completed"}
+    assert completed == ["done-001"]
+    assert monitor.list_active_tasks() == []
+
+
+@pytest.mark.asyncio
+async def test_deadline_raises_timeout_and_calls_on_error():
+    monitor = Monitor()
+    errors = []
+    
+    async def stalled(task):
+        await asyncio.sleep(10)
+    
+    monitor._simulate_subagent = stalled
+    
+    with pytest.raises(TimeoutError):
+        await monitor.spawn_with_monitoring(
+            task="Stalled task",
+            tools=[],
+            timeout=0.1,
+            task_id="stalled-001",
+            on_error=lambda task_id, error: errors.append((task_id, error))
+        )
+    
+    assert len(errors) == 1
+    assert errors[0][0] == "stalled-001"
+    assert isinstance(errors[0][1], TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_producer_exception_raises_subagent_error():
+    monitor = Monitor()
+    
+    async def failing(task):
+        await asyncio.sleep(0.01)
+        raise asyncio.TimeoutError()
+    
+    monitor._simulate_subagent = failing
+    
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(SubagentError):
+        await monitor.spawn_with_monitoring(task="Failing task", tools=[], timeout=5)
+    
+    # Fails as soon as the producer does, not at the deadline
+    assert loop.time() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_producer_returning_without_complete_raises_subagent_error():
+    monitor = Monitor()
+    
+    async def abandoned(task):
+        task.report_progress(50)
+    
+    monitor._simulate_subagent = abandoned
+    
+    with pytest.raises(SubagentError, match="without a result"):
+        await monitor.spawn_with_monitoring(task="Abandoned task", tools=[], timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_default_monitor_gives_concurrent_tasks_unique_ids():
+    default = monitor_module._get_default()
+    completed = []
+    seen = []
+    
+    async def watch():
+        await asyncio.sleep(0.05)
+        seen.extend(snapshot.task_id for snapshot in default.list_active_tasks())
+    
+    await asyncio.gather(
+        monitor_module.spawn_with_monitoring(
+            "First", [], timeout=0.2,
+            on_complete=lambda task_id, result: completed.append(task_id)
+        ),
+        monitor_module.spawn_with_monitoring(
+            "Second", [], timeout=0.4,
+            on_complete=lambda task_id, result: completed.append(task_id)
+        ),
+        watch()
+    )
+    
+    assert len(set(seen)) == 2
+    assert len(set(completed)) == 2
+    assert default.list_active_tasks() == []